@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
+from collections import deque
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Self
 from urllib.parse import urljoin, urlsplit
 
 import httpx
+import orjson
 from asgi_correlation_id import correlation_id as _correlation_id_ctx
 
+from gtex_link.api.rate_limiter import TokenBucketRateLimiter
 from gtex_link.api.url_guard import (
     DisallowedURLError,
     ResponseTooLargeError,
@@ -47,6 +49,13 @@ if TYPE_CHECKING:
 
     from gtex_link.config import GTExAPIConfigModel
 
+__all__ = [
+    "MAX_RESPONSE_BYTES",
+    "MAX_RESPONSE_TIMES",
+    "GTExClient",
+    "TokenBucketRateLimiter",
+]
+
 # Constants
 MAX_RESPONSE_TIMES = 100
 
@@ -57,80 +66,6 @@ MAX_RESPONSE_TIMES = 100
 MAX_RESPONSE_BYTES = 16 * 1024 * 1024
 
 
-class TokenBucketRateLimiter:
-    """Token bucket rate limiter for API requests."""
-
-    # Constants for rate calculation
-    _RATE_WINDOW_SECONDS = 10.0
-    _MIN_REQUESTS_FOR_RATE = 2
-
-    def __init__(self, rate: float, burst: int = 1) -> None:
-        """Initialize rate limiter.
-
-        Args:
-            rate: Requests per second
-            burst: Maximum burst size
-        """
-        self.rate = rate
-        self.burst = float(burst)
-        self.tokens = float(burst)
-        self.last_update = time.time()
-        self._lock = asyncio.Lock()
-        self.request_times: list[float] = []
-
-    async def acquire(self) -> float:
-        """Acquire a token, waiting if necessary.
-
-        Returns:
-            Wait time in seconds (0 if no wait required)
-        """
-        async with self._lock:
-            now = time.time()
-            # Add tokens based on elapsed time
-            elapsed = now - self.last_update
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.last_update = now
-
-            if self.tokens >= 1:
-                self.tokens -= 1
-                # Track request time for rate calculation
-                self.request_times.append(now)
-                # Keep only recent requests
-                self.request_times = [
-                    t for t in self.request_times if now - t <= self._RATE_WINDOW_SECONDS
-                ]
-                return 0.0
-            # Calculate wait time for next token
-            return (1 - self.tokens) / self.rate
-
-    @property
-    def current_tokens(self) -> float:
-        """Get current number of available tokens without updating state."""
-        now = time.time()
-        elapsed = now - self.last_update
-        return min(self.burst, self.tokens + elapsed * self.rate)
-
-    def current_rate(self) -> float:
-        """Get current rate based on recent request times.
-
-        Returns:
-            Current estimated rate in requests per second
-        """
-        now = time.time()
-        # Clean up old request times
-        recent_requests = [t for t in self.request_times if now - t <= self._RATE_WINDOW_SECONDS]
-
-        if len(recent_requests) < self._MIN_REQUESTS_FOR_RATE:
-            return 0.0
-
-        # Calculate rate based on requests over time window
-        time_window = now - recent_requests[0]
-        if time_window <= 0:
-            return 0.0
-
-        return len(recent_requests) / time_window
-
-
 class GTExClient:
     """HTTP client for GTEx Portal API with rate limiting and error handling."""
 
@@ -157,11 +92,17 @@ class GTExClient:
         # configured base URL -- never hardcoded -- so an operator override of
         # base_url stays enforceable.
         self._allowed_origins = build_allowed_origins(config.base_url)
+        # Absolute URL for every configured endpoint, joined once here instead of
+        # re-parsing base URL and path with urljoin on every request.
+        self._endpoint_urls = {
+            path: urljoin(config.base_url, path) for path in config.endpoints.values()
+        }
 
         # Initialize statistics tracking
         self.total_requests = 0
         self.successful_requests = 0
-        self.response_times: list[float] = []
+        # Bounded to the most recent MAX_RESPONSE_TIMES; the oldest is evicted on append.
+        self.response_times: deque[float] = deque(maxlen=MAX_RESPONSE_TIMES)
 
         # Initialize rate limiter (private attribute for tests)
         self._rate_limiter = TokenBucketRateLimiter(
@@ -292,8 +233,8 @@ class GTExClient:
                 self.logger.debug("Rate limit applied", wait_time=wait_time)
             await asyncio.sleep(wait_time)
 
-        # Construct full URL
-        url = urljoin(self.config.base_url, endpoint)
+        # Construct full URL (configured endpoints were joined in __init__)
+        url = self._endpoint_urls.get(endpoint) or urljoin(self.config.base_url, endpoint)
 
         # Build per-request headers; propagate inbound correlation ID if present.
         headers = _inject_correlation_header(None)
@@ -301,12 +242,13 @@ class GTExClient:
         # Get session (lazy initialization)
         session = await self._get_session()
 
-        # Make request with retries
+        # Make request with retries. Durations use the monotonic perf_counter, as
+        # the metrics middleware does, so wall-clock steps cannot skew them.
         last_error: Exception | None = None
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         for attempt in range(self.config.max_retries + 1):
-            attempt_start = time.time()
+            attempt_start = time.perf_counter()
             status_for_metric = 0
             try:
                 # Stream so the response body can be capped BEFORE decoding
@@ -321,7 +263,7 @@ class GTExClient:
                 ) as response:
                     status_for_metric = response.status_code
 
-                    response_time = time.time() - start_time
+                    response_time = time.perf_counter() - start_time
 
                     # Log successful request
                     if self.logger:
@@ -360,26 +302,35 @@ class GTExClient:
 
                     response.raise_for_status()
 
+                    # A declared non-JSON media type (e.g. an HTML error page from
+                    # a proxy) cannot parse, so fail before downloading the body.
+                    # The header value is upstream-controlled and never surfaced.
+                    content_type = response.headers.get("Content-Type")
+                    if content_type is not None and "json" not in content_type.lower():
+                        if self.logger:
+                            self.logger.warning(
+                                "Non-JSON response from GTEx Portal",
+                                path=urlsplit(url).path,
+                            )
+                        # Counted as a finished, unsuccessful request, like a
+                        # body that fails to decode below.
+                        self.total_requests += 1
+                        msg = (
+                            f"Invalid JSON response from GTEx Portal (HTTP {response.status_code})."
+                        )
+                        raise GTExAPIError(msg, status_code=response.status_code)
+
                     # Read the body under the fail-closed byte cap BEFORE decode
                     # (F-17); an oversized body is REFUSED, never truncated.
                     body = await self._read_capped_bytes(response)
-
-                    # Track successful request statistics
+                    # A finished request counts toward the total; it only counts
+                    # as successful once the body has decoded.
                     self.total_requests += 1
-                    self.successful_requests += 1
-                    self.response_times.append(response_time)
-                    # Keep only recent response times (last MAX_RESPONSE_TIMES).
-                    if len(self.response_times) > MAX_RESPONSE_TIMES:
-                        self.response_times = self.response_times[-MAX_RESPONSE_TIMES:]
 
-                    # Parse JSON response
+                    # Parse JSON response (orjson decodes the raw bytes directly)
                     try:
-                        result = json.loads(body)
-                        if not isinstance(result, dict):
-                            # If API returns a list or other type, wrap it
-                            return {"data": result}
-                        return result
-                    except json.JSONDecodeError as e:
+                        result = orjson.loads(body)
+                    except orjson.JSONDecodeError as e:
                         if self.logger:
                             # Log only the request path -- never the raw upstream
                             # body (no-PII-in-logs invariant); the response body
@@ -400,6 +351,14 @@ class GTExClient:
                             status_code=response.status_code,
                         ) from e
 
+                    # Track successful request statistics
+                    self.successful_requests += 1
+                    self.response_times.append(response_time)
+                    if not isinstance(result, dict):
+                        # If API returns a list or other type, wrap it
+                        return {"data": result}
+                    return result
+
             except (DisallowedURLError, ResponseTooLargeError, httpx.TooManyRedirects) as e:
                 # Fail-closed URL/size policy violation on some hop (F-17).
                 # NON-RETRYABLE: mapped to the dedicated UpstreamPolicyError so
@@ -419,7 +378,7 @@ class GTExClient:
                 raise UpstreamPolicyError(msg) from None
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 last_error = e
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
 
                 if self.logger:
                     # Log only the exception TYPE (and path), never str(e): a
@@ -453,7 +412,7 @@ class GTExClient:
                 record_upstream_call(
                     endpoint=self._endpoint_label(url),
                     status=status_for_metric,
-                    duration_s=time.time() - attempt_start,
+                    duration_s=time.perf_counter() - attempt_start,
                 )
 
         # All retries exhausted
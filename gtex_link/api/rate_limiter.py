@@ -0,0 +1,97 @@
+"""Token bucket rate limiter for outbound GTEx Portal requests."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class TokenBucketRateLimiter:
+    """Token bucket rate limiter for API requests.
+
+    Timestamps are integer nanoseconds from ``time.monotonic_ns()``, so wall-clock
+    adjustments cannot skew token refill or the measured rate. Durations are
+    converted to float seconds only where they leave the limiter.
+    """
+
+    __slots__ = ("burst", "last_update", "rate", "request_times", "tokens")
+
+    # Constants for rate calculation
+    _RATE_WINDOW_NS = 10 * _NS_PER_SECOND
+    _MIN_REQUESTS_FOR_RATE = 2
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rate: Requests per second
+            burst: Maximum burst size
+        """
+        self.rate = rate
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.last_update = time.monotonic_ns()
+        # Oldest first; entries past the rate window are dropped from the left.
+        self.request_times: deque[int] = deque()
+
+    async def acquire(self) -> float:
+        """Acquire a token, waiting if necessary.
+
+        Returns:
+            Wait time in seconds (0 if no wait required)
+        """
+        # No lock: nothing below awaits, so on the single event loop the refill
+        # and the token decrement run atomically with respect to other callers.
+        now = time.monotonic_ns()
+        # Add tokens based on elapsed time
+        elapsed = (now - self.last_update) / _NS_PER_SECOND
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.last_update = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            # Track request time for rate calculation
+            self.request_times.append(now)
+            self._prune_request_times(now)
+            return 0.0
+        # Calculate wait time for next token
+        return (1 - self.tokens) / self.rate
+
+    def _prune_request_times(self, now: int) -> None:
+        """Drop request times older than the rate window.
+
+        Times are appended in order, so the stale ones are all at the left end.
+        """
+        request_times = self.request_times
+        cutoff = now - self._RATE_WINDOW_NS
+        while request_times and request_times[0] < cutoff:
+            request_times.popleft()
+
+    @property
+    def current_tokens(self) -> float:
+        """Get current number of available tokens without updating state."""
+        elapsed = (time.monotonic_ns() - self.last_update) / _NS_PER_SECOND
+        return min(self.burst, self.tokens + elapsed * self.rate)
+
+    def current_rate(self) -> float:
+        """Get current rate based on recent request times.
+
+        Returns:
+            Current estimated rate in requests per second
+        """
+        now = time.monotonic_ns()
+        # Clean up old request times
+        self._prune_request_times(now)
+        recent_requests = self.request_times
+
+        if len(recent_requests) < self._MIN_REQUESTS_FOR_RATE:
+            return 0.0
+
+        # Calculate rate based on requests over time window
+        time_window = now - recent_requests[0]
+        if time_window <= 0:
+            return 0.0
+
+        return len(recent_requests) * _NS_PER_SECOND / time_window
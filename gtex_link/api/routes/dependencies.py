@@ -6,45 +6,65 @@ and utilities used across route handlers.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import structlog
 from fastapi import Depends
 
 from gtex_link.api.client import GTExClient
 from gtex_link.config import get_api_config, get_cache_config
-from gtex_link.logging_config import configure_logging
 from gtex_link.services.gtex_service import GTExService
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
-
     from structlog.typing import FilteringBoundLogger
 
 
-async def get_gtex_client() -> AsyncGenerator[GTExClient, None]:
-    """Dependency to get GTEx client instance.
+@lru_cache(maxsize=1)
+def _shared_gtex_client() -> GTExClient:
+    """Build the process-wide GTEx client for REST routes on first use.
+
+    Logging is configured by the application lifespan, so the client only
+    fetches the same logger :func:`get_logger_dependency` returns.
+    """
+    return GTExClient(config=get_api_config(), logger=structlog.get_logger("gtex_link"))
+
 
-    Yields:
-        GTEx client with proper lifecycle management
+async def get_gtex_client() -> GTExClient:
+    """Dependency to get the shared GTEx client instance.
+
+    Every request reuses one client, so its pooled httpx connections and its
+    rate limiter persist across requests instead of being rebuilt per call.
+
+    Returns:
+        Shared GTEx client
     """
-    config = get_api_config()
-    logger = configure_logging()
-    client = GTExClient(config=config, logger=logger)
-    try:
-        yield client
-    finally:
-        # GTExClient doesn't need explicit cleanup in current implementation
-        # but this provides the pattern for future enhancements
-        pass
-
-
-def get_logger_dependency() -> FilteringBoundLogger:
+    return _shared_gtex_client()
+
+
+async def close_gtex_client() -> None:
+    """Close the shared GTEx client, if one was built (application shutdown)."""
+    if _shared_gtex_client.cache_info().currsize:
+        await _shared_gtex_client().close()
+    reset_gtex_client()
+
+
+def reset_gtex_client() -> None:
+    """Clear the cached client without closing it (test helper)."""
+    _shared_gtex_client.cache_clear()
+
+
+async def get_logger_dependency() -> FilteringBoundLogger:
     """Dependency to get logger instance.
 
+    Logging is configured once by the application lifespan, so this only
+    fetches the configured logger. That is cheap enough to run on the event
+    loop, which is why the dependency is ``async`` and skips the threadpool.
+
     Returns:
         Structured logger instance
     """
-    return configure_logging()
+    return structlog.get_logger("gtex_link")  # type: ignore[no-any-return]
 
 
 # Type aliases for cleaner route signatures
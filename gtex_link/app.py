@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from . import __version__
 from .api.routes import expression_router, health_router, reference_router
+from .api.routes.dependencies import close_gtex_client
 from .config import settings
 from .logging_config import configure_logging, log_server_startup
 
@@ -26,6 +27,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     logger.info("Application shutting down")
+    await close_gtex_client()
 
 
 def create_app() -> FastAPI:
@@ -35,9 +35,16 @@ def _server_version() -> str:
     return __version__
 
 
+# The tissue vocabulary is fixed at import time: the ordered tuple backs the
+# advertised list and the frozenset gives `ensure_valid_tissue` an O(1) check
+# instead of rebuilding and scanning the list on every tool call.
+_TISSUES: tuple[str, ...] = tuple(t.value for t in TissueSiteDetailId if t.value)
+_TISSUE_SET: frozenset[str] = frozenset(_TISSUES)
+
+
 def valid_tissues() -> list[str]:
     """The advertised tissue vocabulary: real tissues only, no '' sentinel."""
-    return [t.value for t in TissueSiteDetailId if t.value]
+    return list(_TISSUES)
 
 
 def ensure_valid_tissue(tissue: str | None) -> None:
@@ -47,19 +54,17 @@ def ensure_valid_tissue(tissue: str | None) -> None:
     list, twice) out of the client-facing error. `None` means "all tissues" and
     passes. Shared by every tool that accepts a tissue filter.
     """
-    if tissue is None:
+    if tissue is None or tissue in _TISSUE_SET:
         return
-    allowed = valid_tissues()
-    if tissue not in allowed:
-        sample = ", ".join(allowed[:8])
-        raise McpToolError(
-            error_code="invalid_input",
-            message=(
-                f"Unknown tissue_site_detail_id {tissue!r}. "
-                f"Valid values include: {sample}, ... ({len(allowed)} total; "
-                "see get_server_capabilities.tissues)."
-            ),
-        )
+    sample = ", ".join(_TISSUES[:8])
+    raise McpToolError(
+        error_code="invalid_input",
+        message=(
+            f"Unknown tissue_site_detail_id {tissue!r}. "
+            f"Valid values include: {sample}, ... ({len(_TISSUES)} total; "
+            "see get_server_capabilities.tissues)."
+        ),
+    )
 
 
 def ensure_known_dataset(dataset_id: str) -> None:
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
 import respx
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 from gtex_link.api.client import GTExClient
+from gtex_link.api.routes.dependencies import close_gtex_client, reset_gtex_client
 from gtex_link.app import create_app
 from gtex_link.config import CacheConfigModel, GTExAPIConfigModel, ServerSettings
 from gtex_link.services.gtex_service import GTExService
@@ -35,9 +34,29 @@ from .fixtures.gtex_api_responses import (
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
 
+# Give the shared assertion helpers pytest's detailed assert introspection.
+pytest.register_assert_rewrite("tests.helpers")
 
 GTEX_BASE = "https://test.gtexportal.org/api/v2"  # matches test_api_config.base_url
 
+# Canned stats served by the mock client and service. Built once; fixtures hand
+# each test its own copy so a test that mutates them cannot leak into another.
+MOCK_CLIENT_STATS: Final[dict[str, float]] = {
+    "total_requests": 10,
+    "successful_requests": 9,
+    "success_rate": 0.9,
+    "current_rate": 2.5,
+    "current_tokens": 8.0,
+    "avg_response_time": 0.15,
+}
+MOCK_CACHE_STATS: Final[dict[str, float]] = {
+    "hits": 15,
+    "misses": 5,
+    "hit_rate": 75.0,
+    "total_requests": 20,
+    "cached_functions": 5,
+}
+
 
 @pytest.fixture
 def respx_mock() -> Generator[respx.MockRouter, None, None]:
@@ -46,14 +65,6 @@ def respx_mock() -> Generator[respx.MockRouter, None, None]:
         yield router
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def test_api_config() -> GTExAPIConfigModel:
     """Create test API configuration."""
@@ -96,27 +107,44 @@ def test_settings(
     return settings
 
 
-@pytest.fixture
-def app():
-    """Create FastAPI app for testing."""
-    return create_app()
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def _reset_gtex_client() -> AsyncGenerator[None, None]:
+    """Reset the shared REST GTExClient before each test and close it after.
 
+    Why: the route dependency caches one client per process, so its httpx
+    pool and rate limiter would otherwise carry over between tests and across
+    pytest's per-test event loops. Teardown closes the client on the session
+    loop the route tests run on, so no test leaves an httpx pool open.
+    """
+    reset_gtex_client()
+    yield
+    await close_gtex_client()
 
-@pytest.fixture
-def test_client(app) -> Generator[TestClient, None, None]:
-    """Create test client."""
-    client = TestClient(app)
-    yield client
-    client.close()
 
+@pytest.fixture(scope="session")
+def app():
+    """Create FastAPI app for testing.
+
+    Session-scoped: routes, dependency wiring and validators are built once.
+    Tests that install ``dependency_overrides`` must remove them again.
+    """
+    return create_app()
 
-@pytest_asyncio.fixture
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test client."""
-    from httpx._transports.asgi import ASGITransport
+    """Create an async test client shared by the whole session.
 
+    Tests using it must run on the session loop:
+    ``@pytest.mark.asyncio(loop_scope="session")``. ``ASGITransport`` does not
+    send lifespan events, so the app's lifespan is entered here, once, around
+    the whole session.
+    """
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with (
+        app.router.lifespan_context(app),
+        AsyncClient(transport=transport, base_url="http://test") as client,
+    ):
         yield client
 
 
@@ -144,14 +172,7 @@ def mock_gtex_client(test_api_config: GTExAPIConfigModel) -> MagicMock:
     mock_client.get_top_expressed_genes.return_value = TOP_EXPRESSED_GENES_RESPONSE
 
     # Mock stats
-    mock_client.stats = {
-        "total_requests": 10,
-        "successful_requests": 9,
-        "success_rate": 0.9,
-        "current_rate": 2.5,
-        "current_tokens": 8.0,
-        "avg_response_time": 0.15,
-    }
+    mock_client.stats = dict(MOCK_CLIENT_STATS)
 
     return mock_client
 
@@ -166,23 +187,10 @@ def mock_gtex_service(
     mock_service.cache_config = test_cache_config
 
     # Configure cache stats property
-    mock_service.cache_stats = {
-        "hits": 15,
-        "misses": 5,
-        "hit_rate": 75.0,
-        "total_requests": 20,
-        "cached_functions": 5,
-    }
+    mock_service.cache_stats = dict(MOCK_CACHE_STATS)
 
     # Configure client stats property
-    mock_service.client_stats = {
-        "total_requests": 10,
-        "successful_requests": 9,
-        "success_rate": 0.9,
-        "current_rate": 2.5,
-        "current_tokens": 8.0,
-        "avg_response_time": 0.15,
-    }
+    mock_service.client_stats = dict(MOCK_CLIENT_STATS)
 
     mock_service.get_cache_info.return_value = {
         "search_genes": {
@@ -253,10 +261,10 @@ def test_variant_ids():
     return TEST_VARIANT_IDS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_tissue_ids():
-    """Common tissue IDs for testing."""
-    return TEST_TISSUE_IDS
+    """Common tissue IDs for testing, shared read-only across the session."""
+    return tuple(TEST_TISSUE_IDS)
 
 
 # Response fixtures for different scenarios
@@ -371,10 +379,10 @@ def api_error_responses():
 
 
 # Performance testing fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_gene_list():
-    """Large list of genes for performance testing."""
-    return TEST_GENE_SYMBOLS * 100  # 800 genes
+    """Large list of genes for performance testing, built once per session."""
+    return tuple(TEST_GENE_SYMBOLS) * 100  # 800 genes
 
 
 @pytest.fixture
@@ -216,6 +216,13 @@ SERVICE_INFO_RESPONSE: dict[str, Any] = {
     "title": "GTEx Portal API",
 }
 
+# Empty page in the GTEx paginated envelope. Used where a fixture would omit
+# fields the response model requires, so no data has to be invented.
+EMPTY_PAGE_RESPONSE: dict[str, Any] = {
+    "data": [],
+    "pagingInfo": {"numberOfPages": 0, "page": 0, "maxItemsPerPage": 250, "totalNumberOfItems": 0},
+}
+
 # Error response examples
 ERROR_RESPONSES: dict[str, dict[str, Any]] = {
     "validation_error": {
@@ -0,0 +1,54 @@
+"""Shared assertion helpers for the test suite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final
+
+import orjson
+
+if TYPE_CHECKING:
+    import httpx
+
+ASGI_BASE_URL: Final = "http://test"  # matches the async_client fixture's base_url
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a response body once with orjson.
+
+    Faster than ``response.json()`` (stdlib ``json`` over decoded text) on the
+    large ``data`` arrays some route tests return.
+    """
+    return orjson.loads(response.content)
+
+
+def assert_ok(response: httpx.Response) -> httpx.Response:
+    """Assert a 200 response and return it for chaining.
+
+    Checks for exactly 200 rather than ``raise_for_status()``, which would
+    also accept any other 2xx.
+    """
+    assert response.status_code == 200, response.text
+    return response
+
+
+def assert_page(response: httpx.Response) -> httpx.Response:
+    """Assert a 200 paginated GTEx envelope and return the response.
+
+    Route tests only check the envelope's shape, so the keys are matched on
+    the raw bytes instead of decoding the body. Pydantic serialises fields in
+    declaration order, so ``data`` always leads and ``pagingInfo`` follows it.
+    """
+    body = assert_ok(response).content
+    assert body.startswith(b'{"data":['), response.text
+    assert b'],"pagingInfo":{' in body, response.text
+    return response
+
+
+def assert_validation_error(response: httpx.Response) -> None:
+    """Assert a FastAPI 422 whose body carries a top-level ``detail`` key.
+
+    Starlette renders JSON compactly, so the key is the first thing in the
+    body and can be checked on the raw bytes without decoding.
+    """
+    assert response.status_code == 422, response.text
+    assert response.content.startswith(b'{"detail":'), response.text
@@ -0,0 +1,82 @@
+"""Shared fixtures for REST route tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import respx
+
+from gtex_link.api.routes.dependencies import get_gtex_client, get_gtex_service
+from tests.fixtures.gtex_api_responses import (
+    EMPTY_PAGE_RESPONSE,
+    GENE_SEARCH_RESPONSE,
+    MEDIAN_GENE_EXPRESSION_RESPONSE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from unittest.mock import AsyncMock
+
+    from fastapi import FastAPI
+
+# Production GTEx Portal base URL; the FastAPI app reads ``settings.api.base_url``
+# from the global config, which defaults to the real API. Respx patterns target
+# that URL so the running app's outbound httpx calls are intercepted.
+GTEX_API_BASE = "https://gtexportal.org/api/v2"
+
+
+@pytest.fixture(scope="module")
+def gtex_backend() -> Iterator[respx.MockRouter]:
+    """Canned GTEx Portal backend shared by every route test in a module.
+
+    Routes are registered once per module instead of once per test. Any
+    outbound call without a canned route fails the test rather than reaching
+    the live portal.
+
+    ``TOP_EXPRESSED_GENES_RESPONSE`` omits fields required by the response
+    model (ontologyId, datasetId, unit, median), so the top-expressed and
+    transcript routes answer with an empty page instead of invented data.
+    """
+    with respx.mock(base_url=GTEX_API_BASE, assert_all_called=False) as router:
+        router.get("/expression/medianGeneExpression").respond(
+            200, json=MEDIAN_GENE_EXPRESSION_RESPONSE
+        )
+        router.get("/expression/topExpressedGene").respond(200, json=EMPTY_PAGE_RESPONSE)
+        router.get("/reference/geneSearch").respond(200, json=GENE_SEARCH_RESPONSE)
+        router.get("/reference/gene").respond(200, json=GENE_SEARCH_RESPONSE)
+        router.get("/reference/transcript").respond(200, json=EMPTY_PAGE_RESPONSE)
+        yield router
+
+
+class _UpstreamForbiddenService:
+    """GTEx service stand-in that fails the test on any use."""
+
+    def __getattr__(self, name: str) -> Any:
+        msg = f"Validation-only request reached the GTEx service ({name})"
+        raise AssertionError(msg)
+
+
+@pytest.fixture
+def upstream_forbidden(app: FastAPI) -> Iterator[None]:
+    """Swap the GTEx service dependency for a stand-in that must never be used.
+
+    For validation-only tests: no real client or service is built, and a
+    request that slips past validation ends in a 500 (the route's catch-all
+    handler) instead of being answered by the canned backend.
+    """
+    app.dependency_overrides[get_gtex_service] = _UpstreamForbiddenService
+    yield
+    app.dependency_overrides.pop(get_gtex_service, None)
+
+
+@pytest.fixture
+def gtex_client_stub(app: FastAPI, mock_gtex_client: AsyncMock) -> Iterator[AsyncMock]:
+    """Answer routes from the shared ``mock_gtex_client`` instead of a real client.
+
+    For tests that only check the route contract: no ``GTExClient``, rate
+    limiter or httpx transport is built per request.
+    """
+    app.dependency_overrides[get_gtex_client] = lambda: mock_gtex_client
+    yield mock_gtex_client
+    app.dependency_overrides.pop(get_gtex_client, None)
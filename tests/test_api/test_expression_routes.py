@@ -2,70 +2,73 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Final
 
 import pytest
 
+from tests.helpers import assert_ok, assert_page, assert_validation_error
+
 if TYPE_CHECKING:
-    import respx
-    from fastapi.testclient import TestClient
     from httpx import AsyncClient
 
-# Production GTEx Portal base URL; the FastAPI app reads ``settings.api.base_url``
-# from the global config, which defaults to the real API. Respx patterns target
-# that URL so the running app's outbound httpx calls are intercepted.
-GTEX_API_BASE = "https://gtexportal.org/api/v2"
-
-EMPTY_PAGE: dict[str, Any] = {
-    "data": [],
-    "pagingInfo": {
-        "numberOfPages": 0,
-        "page": 0,
-        "maxItemsPerPage": 250,
-        "totalNumberOfItems": 0,
-    },
-}
-
-
+# Every route test runs against the canned GTEx backend; nothing reaches the portal.
+# All tests share the session-scoped ``async_client`` and therefore its event loop.
+pytestmark = [
+    pytest.mark.usefixtures("gtex_backend"),
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+# Query strings reused across tests, as immutable (key, value) pairs that httpx
+# accepts directly for ``params``.
+QueryParams = tuple[tuple[str, str | bool], ...]
+BRCA1_WHOLE_BLOOD: Final[QueryParams] = (
+    ("gencodeId", "ENSG00000012048.20"),
+    ("tissueSiteDetailId", "Whole_Blood"),
+)
+TP53_LIVER: Final[QueryParams] = (
+    ("gencodeId", "ENSG00000141510.11"),
+    ("tissueSiteDetailId", "Liver"),
+)
+TOP_GENES_WHOLE_BLOOD: Final[QueryParams] = (
+    ("tissueSiteDetailId", "Whole_Blood"),
+    ("filterMtGene", True),
+)
+
+# (url, params) pairs that must fail request validation with 422.
+BAD_CASES = [
+    pytest.param("/api/expression/median-gene-expression", {}, id="median_missing_parameters"),
+    pytest.param("/api/expression/top-expressed-genes", {}, id="top_missing_tissue"),
+    pytest.param("/api/expression/gene-expression", {}, id="individual_missing_gene"),
+    pytest.param(
+        "/api/expression/median-gene-expression",
+        {"gencodeId": [], "tissueSiteDetailId": "Whole_Blood"},
+        id="median_empty_gencode_id",
+    ),
+    pytest.param(
+        "/api/expression/gene-expression",
+        {"gencodeId": ["ENSG00000012048.20"], "page": 0, "itemsPerPage": 1001},
+        id="individual_page_size_too_large",
+    ),
+]
+
+
+@pytest.mark.xdist_group(name="expression_median")
 class TestMedianExpressionRoutes:
     """Test median gene expression API routes."""
 
-    def test_get_median_expression_basic(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        median_expression_response: dict[str, Any],
-    ) -> None:
+    async def test_get_median_expression_basic(self, async_client: AsyncClient) -> None:
         """Test basic median expression retrieval."""
-        respx_mock.get(f"{GTEX_API_BASE}/expression/medianGeneExpression").respond(
-            200, json=median_expression_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/median-gene-expression",
-            params={
-                "gencodeId": ["ENSG00000012048.20"],
-                "tissueSiteDetailId": "Whole_Blood",
-            },
+            params=BRCA1_WHOLE_BLOOD,
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        assert "pagingInfo" in data
+        assert_page(response)
 
-    def test_get_median_expression_multiple_genes(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        median_expression_response: dict[str, Any],
-    ) -> None:
+    async def test_get_median_expression_multiple_genes(self, async_client: AsyncClient) -> None:
         """Test median expression for multiple genes."""
-        respx_mock.get(f"{GTEX_API_BASE}/expression/medianGeneExpression").respond(
-            200, json=median_expression_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/median-gene-expression",
             params={
                 "gencodeId": [
@@ -77,76 +80,34 @@ class TestMedianExpressionRoutes:
             },
         )
 
-        assert response.status_code == 200
+        assert_ok(response)
 
-    def test_get_median_expression_by_gencode_id(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        median_expression_response: dict[str, Any],
-    ) -> None:
+    async def test_get_median_expression_by_gencode_id(self, async_client: AsyncClient) -> None:
         """Test median expression by Gencode ID."""
-        respx_mock.get(f"{GTEX_API_BASE}/expression/medianGeneExpression").respond(
-            200, json=median_expression_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/median-gene-expression",
-            params={
-                "gencodeId": ["ENSG00000012048.20"],
-                "tissueSiteDetailId": "Whole_Blood",
-            },
+            params=BRCA1_WHOLE_BLOOD,
         )
 
-        assert response.status_code == 200
-
-    def test_get_median_expression_missing_parameters(self, test_client: TestClient) -> None:
-        """Test median expression without required parameters."""
-        response = test_client.get("/api/expression/median-gene-expression")
-
-        assert response.status_code == 422
-        error_data = response.json()
-        assert "detail" in error_data
+        assert_ok(response)
 
 
+@pytest.mark.xdist_group(name="expression_top")
 class TestTopExpressedGenesRoutes:
     """Test top expressed genes API routes."""
 
-    def test_get_top_expressed_genes_basic(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-    ) -> None:
+    async def test_get_top_expressed_genes_basic(self, async_client: AsyncClient) -> None:
         """Test basic top expressed genes retrieval."""
-        # ``TOP_EXPRESSED_GENES_RESPONSE`` fixture omits fields required by the
-        # response model (ontologyId, datasetId, unit, median). Returning an
-        # empty page keeps the response shape valid without inventing data.
-        respx_mock.get(f"{GTEX_API_BASE}/expression/topExpressedGene").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/top-expressed-genes",
-            params={
-                "tissueSiteDetailId": "Whole_Blood",
-                "filterMtGene": True,
-            },
+            params=TOP_GENES_WHOLE_BLOOD,
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        assert "pagingInfo" in data
-
-    def test_get_top_expressed_genes_missing_tissue(self, test_client: TestClient) -> None:
-        """Test top expressed genes without tissue parameter."""
-        response = test_client.get("/api/expression/top-expressed-genes")
-
-        assert response.status_code == 422
-        error_data = response.json()
-        assert "detail" in error_data
+        assert_page(response)
 
-    def test_get_top_expressed_genes_invalid_tissue(self, test_client: TestClient) -> None:
+    async def test_get_top_expressed_genes_invalid_tissue(self, async_client: AsyncClient) -> None:
         """Test top expressed genes with invalid tissue."""
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/top-expressed-genes",
             params={
                 "tissueSiteDetailId": "Invalid_Tissue",
@@ -156,73 +117,67 @@ class TestTopExpressedGenesRoutes:
         assert response.status_code == 422
 
 
-class TestIndividualExpressionRoutes:
-    """Test individual gene expression API routes."""
-
-    def test_get_individual_expression_missing_gene(self, test_client: TestClient) -> None:
-        """Test individual expression without gene parameter."""
-        response = test_client.get("/api/expression/gene-expression")
-
-        assert response.status_code == 422
-        error_data = response.json()
-        assert "detail" in error_data
-
-
+@pytest.mark.xdist_group(name="expression_async")
 class TestAsyncExpressionRoutes:
     """Test async expression routes."""
 
-    @pytest.mark.asyncio
-    async def test_async_median_expression(
-        self,
-        async_client: AsyncClient,
-        respx_mock: respx.MockRouter,
-        median_expression_response: dict[str, Any],
-    ) -> None:
-        """Test async median expression retrieval."""
-        if async_client is None:
-            pytest.skip("Async client not available")
+    async def test_async_expression_suite(self, async_client: AsyncClient) -> None:
+        """Test async expression routes issued concurrently on one client."""
+        cases: list[tuple[str, QueryParams]] = [
+            ("/api/expression/median-gene-expression", BRCA1_WHOLE_BLOOD),
+            ("/api/expression/median-gene-expression", TP53_LIVER),
+            ("/api/expression/top-expressed-genes", TOP_GENES_WHOLE_BLOOD),
+        ]
 
-        respx_mock.get(f"{GTEX_API_BASE}/expression/medianGeneExpression").respond(
-            200, json=median_expression_response
+        responses = await asyncio.gather(
+            *(async_client.get(path, params=params) for path, params in cases)
         )
 
-        response = await async_client.get(
-            "/api/expression/median-gene-expression",
-            params={
-                "gencodeId": ["ENSG00000012048.20"],
-                "tissueSiteDetailId": "Whole_Blood",
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-
+        for response in responses:
+            assert_page(response)
 
+    async def test_expression_across_tissues(
+        self, async_client: AsyncClient, test_tissue_ids: tuple[str, ...]
+    ) -> None:
+        """Test both tissue-filtered routes for every test tissue in one concurrent batch."""
+        requests = [
+            async_client.get(
+                "/api/expression/median-gene-expression",
+                params={"gencodeId": ["ENSG00000012048.20"], "tissueSiteDetailId": tissue_id},
+            )
+            for tissue_id in test_tissue_ids
+        ]
+        requests += [
+            async_client.get(
+                "/api/expression/top-expressed-genes",
+                params={"tissueSiteDetailId": tissue_id},
+            )
+            for tissue_id in test_tissue_ids
+        ]
+
+        responses = await asyncio.gather(*requests)
+
+        for response in responses:
+            assert_page(response)
+
+
+@pytest.mark.xdist_group(name="expression_errors")
 class TestExpressionRouteErrorHandling:
     """Test error handling in expression routes."""
 
-    def test_median_expression_validation_error(self, test_client: TestClient) -> None:
-        """Test median expression with validation error."""
-        response = test_client.get(
-            "/api/expression/median-gene-expression",
-            params={
-                "gencodeId": [],  # Empty list should cause validation error
-                "tissueSiteDetailId": "Whole_Blood",
-            },
-        )
+    @pytest.mark.usefixtures("upstream_forbidden")
+    @pytest.mark.parametrize(("url", "params"), BAD_CASES)
+    async def test_validation_errors(
+        self, async_client: AsyncClient, url: str, params: dict[str, Any]
+    ) -> None:
+        """Test that invalid query parameters are rejected with 422."""
+        response = await async_client.get(url, params=params)
 
-        assert response.status_code == 422
+        assert_validation_error(response)
 
-    def test_top_genes_invalid_sort_field(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-    ) -> None:
+    async def test_top_genes_invalid_sort_field(self, async_client: AsyncClient) -> None:
         """Test top genes with invalid sort field."""
-        respx_mock.get(f"{GTEX_API_BASE}/expression/topExpressedGene").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/expression/top-expressed-genes",
             params={
                 "tissueSiteDetailId": "Whole_Blood",
@@ -231,17 +186,4 @@ class TestExpressionRouteErrorHandling:
         )
 
         # This should still return 200 since sort_by is ignored
-        assert response.status_code == 200
-
-    def test_individual_expression_invalid_page_size(self, test_client: TestClient) -> None:
-        """Test individual expression with invalid page size."""
-        response = test_client.get(
-            "/api/expression/gene-expression",
-            params={
-                "gencodeId": ["ENSG00000012048.20"],
-                "page": 0,
-                "itemsPerPage": 1001,  # Too large - should cause validation error
-            },
-        )
-
-        assert response.status_code == 422
+        assert_ok(response)
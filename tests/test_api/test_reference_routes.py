@@ -2,86 +2,66 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Final
 
+import httpx
 import pytest
 
-if TYPE_CHECKING:
-    import respx
-    from fastapi.testclient import TestClient
-
-# Production GTEx Portal base URL; the FastAPI app reads ``settings.api.base_url``
-# from the global config, which defaults to the real API. Respx patterns target
-# that URL so the running app's outbound httpx calls are intercepted.
-GTEX_API_BASE = "https://gtexportal.org/api/v2"
-
-EMPTY_PAGE: dict[str, Any] = {
-    "data": [],
-    "pagingInfo": {
-        "numberOfPages": 0,
-        "page": 0,
-        "maxItemsPerPage": 250,
-        "totalNumberOfItems": 0,
-    },
-}
-
+from tests.helpers import ASGI_BASE_URL, assert_ok, assert_page, assert_validation_error
 
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+# Every route test runs against the canned GTEx backend; nothing reaches the portal.
+# All tests share the session-scoped ``async_client`` and therefore its event loop.
+pytestmark = [
+    pytest.mark.usefixtures("gtex_backend"),
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+# Gene searches whose URLs are built and percent-encoded once, at import, and
+# then sent as-is on the shared client.
+GENE_SEARCH_REQUESTS: Final = tuple(
+    httpx.Request("GET", f"{ASGI_BASE_URL}/api/reference/geneSearch", params={"geneId": query})
+    for query in ("BRCA1", "TP53", "EGFR", "KRAS", "PIK3CA")
+)
+
+# Query strings reused across tests, as immutable (key, value) pairs that httpx
+# accepts directly for ``params``.
+QueryParams = tuple[tuple[str, str | int], ...]
+BRCA1_QUERY: Final[QueryParams] = (("geneId", "BRCA1"),)
+BRCA1_GENCODE: Final[QueryParams] = (("gencodeId", "ENSG00000012048.20"),)
+
+
+@pytest.mark.xdist_group(name="reference_gene_search")
 class TestGeneSearchRoutes:
     """Test gene search API routes."""
 
-    def test_search_genes_success(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
+    async def test_search_genes_success(self, async_client: httpx.AsyncClient) -> None:
         """Test successful gene search."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/geneSearch").respond(
-            200, json=gene_search_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/geneSearch",
-            params={
-                "geneId": "BRCA1",
-                "page": 0,
-                "itemsPerPage": 250,
-            },
+            params=(*BRCA1_QUERY, ("page", 0), ("itemsPerPage", 250)),
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "data" in data
-        assert "pagingInfo" in data
-        assert len(data["data"]) >= 0
+        assert_page(response)
 
-    def test_search_genes_missing_query(self, test_client: TestClient) -> None:
+    async def test_search_genes_missing_query(self, async_client: httpx.AsyncClient) -> None:
         """Test gene search without query parameter."""
-        response = test_client.get("/api/reference/geneSearch")
+        response = await async_client.get("/api/reference/geneSearch")
 
-        assert response.status_code == 422
-        error_data = response.json()
-        assert "detail" in error_data
+        assert_validation_error(response)
 
-    def test_search_genes_empty_query(self, test_client: TestClient) -> None:
+    async def test_search_genes_empty_query(self, async_client: httpx.AsyncClient) -> None:
         """Test gene search with empty query."""
-        response = test_client.get("/api/reference/geneSearch", params={"geneId": ""})
+        response = await async_client.get("/api/reference/geneSearch", params={"geneId": ""})
 
         assert response.status_code == 422
 
-    def test_search_genes_with_gencode_id(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
+    async def test_search_genes_with_gencode_id(self, async_client: httpx.AsyncClient) -> None:
         """Test gene search with Gencode ID."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/geneSearch").respond(
-            200, json=gene_search_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/geneSearch",
             params={
                 "geneId": "ENSG00000012048.20",
@@ -89,126 +69,83 @@ class TestGeneSearchRoutes:
             },
         )
 
-        assert response.status_code == 200
+        assert_ok(response)
 
-    def test_search_genes_pagination(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
+    async def test_search_genes_pagination(self, async_client: httpx.AsyncClient) -> None:
         """Test gene search pagination."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/geneSearch").respond(
-            200, json=gene_search_response
-        )
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/geneSearch",
-            params={
-                "geneId": "BRCA1",
-                "page": 1,
-                "itemsPerPage": 50,
-            },
+            params=(*BRCA1_QUERY, ("page", 1), ("itemsPerPage", 50)),
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "pagingInfo" in data
+        assert_page(response)
 
-    def test_search_genes_invalid_page_size(self, test_client: TestClient) -> None:
+    async def test_search_genes_invalid_page_size(self, async_client: httpx.AsyncClient) -> None:
         """Test gene search with invalid page size."""
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/geneSearch",
-            params={
-                "geneId": "BRCA1",
-                "itemsPerPage": 100001,  # Too large for GTEx API limit
-            },
+            params=(*BRCA1_QUERY, ("itemsPerPage", 100001)),  # Too large for GTEx API limit
         )
 
         assert response.status_code == 422
 
-    @pytest.mark.parametrize("gene_query", ["BRCA1", "TP53", "EGFR", "KRAS", "PIK3CA"])
-    def test_search_genes_multiple_queries(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-        gene_query: str,
+    async def test_search_genes_multiple_queries(
+        self, async_client: httpx.AsyncClient, gtex_client_stub: AsyncMock
     ) -> None:
-        """Test gene search with multiple different queries."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/geneSearch").respond(
-            200, json=gene_search_response
-        )
+        """Test gene search with multiple different queries issued concurrently."""
+        responses = await asyncio.gather(*map(async_client.send, GENE_SEARCH_REQUESTS))
 
-        response = test_client.get("/api/reference/geneSearch", params={"geneId": gene_query})
-
-        assert response.status_code == 200
+        for response in responses:
+            assert_ok(response)
+        assert gtex_client_stub.search_genes.await_count == len(GENE_SEARCH_REQUESTS)
 
 
+@pytest.mark.xdist_group(name="reference_gene")
 class TestGeneInfoRoutes:
     """Test gene information API routes."""
 
-    def test_get_genes_success(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
+    async def test_get_genes_success(self, async_client: httpx.AsyncClient) -> None:
         """Test successful gene information retrieval."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/gene").respond(200, json=gene_search_response)
-
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/gene",
             params={
                 "geneId": ["BRCA1", "TP53"],
             },
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        assert "pagingInfo" in data
-
-    def test_get_genes_by_chromosome(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
-        """Test gene retrieval by chromosome - not supported in GTEx API v2, should use gene symbols/IDs."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/gene").respond(200, json=gene_search_response)
-
-        response = test_client.get(
-            "/api/reference/gene",
-            params={
-                "geneId": ["BRCA1", "BRCA2"],
-            },
-        )
-
-        assert response.status_code == 200
-
-    def test_get_genes_genomic_range(
+        assert_page(response)
+
+    # Chromosome, genomic-range and gene-type filters are not supported by the
+    # GTEx API v2; these former filter cases now query by gene symbols/IDs with
+    # the extra filters the route does accept.
+    @pytest.mark.parametrize(
+        "params",
+        [
+            pytest.param({"geneId": ["BRCA1", "BRCA2"]}, id="two_symbols"),
+            pytest.param(
+                {"geneId": ["ENSG00000012048.20"], "genomeBuild": "GRCh38/hg38"},
+                id="genome_build",
+            ),
+            pytest.param(
+                {"geneId": ["BRCA1", "BRCA2", "TP53"], "gencodeVersion": "v26"},
+                id="gencode_version",
+            ),
+            pytest.param(BRCA1_QUERY, id="single_symbol"),
+        ],
+    )
+    async def test_get_genes_with_filters(
         self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
+        async_client: httpx.AsyncClient,
+        params: dict[str, str | list[str]] | QueryParams,
     ) -> None:
-        """Test gene retrieval by genomic range - not supported, use gene IDs."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/gene").respond(200, json=gene_search_response)
-
-        response = test_client.get(
-            "/api/reference/gene",
-            params={
-                "geneId": ["ENSG00000012048.20"],
-                "genomeBuild": "GRCh38/hg38",
-            },
-        )
+        """Test gene retrieval across the supported parameter combinations."""
+        response = await async_client.get("/api/reference/gene", params=params)
 
-        assert response.status_code == 200
+        assert_ok(response)
 
-    def test_get_genes_invalid_range(self, test_client: TestClient) -> None:
+    async def test_get_genes_invalid_range(self, async_client: httpx.AsyncClient) -> None:
         """Test gene retrieval with invalid parameters."""
-        response = test_client.get(
+        response = await async_client.get(
             "/api/reference/gene",
             params={
                 "geneId": [],  # Empty array should cause validation error
@@ -217,115 +154,30 @@ class TestGeneInfoRoutes:
 
         assert response.status_code == 422
 
-    def test_get_genes_multiple_chromosomes(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
-        """Test gene retrieval for multiple genes."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/gene").respond(200, json=gene_search_response)
-
-        response = test_client.get(
-            "/api/reference/gene",
-            params={
-                "geneId": ["BRCA1", "BRCA2", "TP53"],
-                "gencodeVersion": "v26",
-            },
-        )
-
-        assert response.status_code == 200
-
-    def test_get_genes_by_gene_type(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-        gene_search_response: dict[str, Any],
-    ) -> None:
-        """Test gene retrieval - gene type filtering not supported by GTEx API v2."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/gene").respond(200, json=gene_search_response)
-
-        response = test_client.get(
-            "/api/reference/gene",
-            params={
-                "geneId": ["BRCA1"],
-            },
-        )
-
-        assert response.status_code == 200
-
 
+@pytest.mark.xdist_group(name="reference_transcript")
 class TestTranscriptRoutes:
     """Test transcript API routes."""
 
-    def test_get_transcripts_by_gene(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
+    @pytest.mark.parametrize(
+        ("params", "expected_status"),
+        [
+            pytest.param(BRCA1_GENCODE, 200, id="by_gene"),
+            pytest.param((*BRCA1_GENCODE, ("gencodeVersion", "v26")), 200, id="by_gencode_version"),
+            # Genomic-region and transcript-type filters are not supported
+            # upstream; the genome build is the only extra filter accepted.
+            pytest.param(
+                (*BRCA1_GENCODE, ("genomeBuild", "GRCh38/hg38")), 200, id="with_genome_build"
+            ),
+            pytest.param((), 422, id="missing_gencode_id"),
+        ],
+    )
+    async def test_get_transcripts(
+        self, async_client: httpx.AsyncClient, params: QueryParams, expected_status: int
     ) -> None:
-        """Test transcript retrieval by gene."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/transcript").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
-            "/api/reference/transcript",
-            params={
-                "gencodeId": "ENSG00000012048.20",
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-
-    def test_get_transcripts_by_gencode_id(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-    ) -> None:
-        """Test transcript retrieval by Gencode ID."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/transcript").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
-            "/api/reference/transcript",
-            params={
-                "gencodeId": "ENSG00000012048.20",
-                "gencodeVersion": "v26",
-            },
-        )
-
-        assert response.status_code == 200
-
-    def test_get_transcripts_genomic_region(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-    ) -> None:
-        """Test transcript retrieval - genomic region not supported, use gencodeId."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/transcript").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
-            "/api/reference/transcript",
-            params={
-                "gencodeId": "ENSG00000012048.20",
-                "genomeBuild": "GRCh38/hg38",
-            },
-        )
-
-        assert response.status_code == 200
-
-    def test_get_transcripts_by_transcript_type(
-        self,
-        test_client: TestClient,
-        respx_mock: respx.MockRouter,
-    ) -> None:
-        """Test transcript retrieval - transcript type filtering not supported."""
-        respx_mock.get(f"{GTEX_API_BASE}/reference/transcript").respond(200, json=EMPTY_PAGE)
-
-        response = test_client.get(
-            "/api/reference/transcript",
-            params={
-                "gencodeId": "ENSG00000012048.20",
-            },
-        )
+        """Test transcript retrieval across the supported parameter combinations."""
+        response = await async_client.get("/api/reference/transcript", params=params)
 
-        assert response.status_code == 200
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert_page(response)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from typing import TYPE_CHECKING, cast
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from gtex_link.api.client import GTExClient, TokenBucketRateLimiter
+from gtex_link.api.client import MAX_RESPONSE_TIMES, GTExClient, TokenBucketRateLimiter
 from gtex_link.config import GTExAPIConfigModel
 from gtex_link.exceptions import GTExAPIError
 
@@ -28,11 +29,11 @@ class TestTokenBucketRateLimiterEdgeCases:
         """Test current_rate calculation with very close timestamps."""
         limiter = TokenBucketRateLimiter(rate=5.0, burst=10)
 
-        # Timestamps very close together but not identical (current_rate
-        # returns 0.0 when time_window == 0, so the oldest must be slightly
-        # earlier than `now`)
-        now = time.time()
-        limiter.request_times = [now - 1e-6, now - 5e-7, now]
+        # Timestamps (monotonic ns) very close together but not identical
+        # (current_rate returns 0.0 when time_window == 0, so the oldest must be
+        # slightly earlier than `now`)
+        now = time.monotonic_ns()
+        limiter.request_times = deque([now - 1_000, now - 500, now])
 
         # Should return a high rate when timestamps are very close
         rate = limiter.current_rate()
@@ -43,13 +44,20 @@ class TestTokenBucketRateLimiterEdgeCases:
         limiter = TokenBucketRateLimiter(rate=5.0, burst=10)
 
         # Add only 1 request (less than MIN_REQUESTS_FOR_RATE = 2)
-        now = time.time()
-        limiter.request_times = [now]
+        limiter.request_times = deque([time.monotonic_ns()])
 
         # Should return 0.0 when insufficient requests
         rate = limiter.current_rate()
         assert rate == 0.0
 
+    def test_limiter_has_no_instance_dict(self) -> None:
+        """Test that the limiter's state lives in __slots__, not a per-instance dict."""
+        limiter = TokenBucketRateLimiter(rate=5.0, burst=10)
+
+        assert not hasattr(limiter, "__dict__")
+        with pytest.raises(AttributeError):
+            limiter.unexpected = 1  # type: ignore[attr-defined]
+
     async def test_acquire_wait_time_calculation(self) -> None:
         """Test wait time calculation when tokens are insufficient."""
         limiter = TokenBucketRateLimiter(rate=2.0, burst=1)  # Very restrictive
@@ -100,6 +108,37 @@ class TestGTExClientJSONErrorHandling:
 
         # Verify logger was called for JSON parsing error (logger is a MagicMock)
         cast(MagicMock, client.logger).error.assert_called()
+        # Same accounting as a declared non-JSON response: finished, not successful
+        assert client.total_requests == 1
+        assert client.successful_requests == 0
+        assert not client.response_times
+
+    @pytest.mark.asyncio
+    async def test_non_json_content_type_skips_body(
+        self,
+        client_with_logger: GTExClient,
+        respx_mock: respx.MockRouter,
+    ) -> None:
+        """Test that a declared non-JSON response fails without reading the body."""
+        client = client_with_logger
+        respx_mock.get(f"{GTEX_DEFAULT_BASE}/test/endpoint").respond(
+            200,
+            content=b"<html>Bad gateway</html>",
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+        with (
+            patch.object(client, "_read_capped_bytes") as read_body,
+            pytest.raises(GTExAPIError, match="Invalid JSON response") as exc_info,
+        ):
+            await client._make_request("GET", "test/endpoint")
+
+        read_body.assert_not_called()
+        assert exc_info.value.status_code == 200
+        assert "html" not in str(exc_info.value).lower()
+        cast(MagicMock, client.logger).warning.assert_called_once()
+        assert client.total_requests == 1
+        assert client.successful_requests == 0
 
     @pytest.mark.asyncio
     async def test_json_decode_error_without_logger(
@@ -142,7 +181,7 @@ class TestGTExClientResponseProcessing:
         client = client_with_logger
 
         # Fill response_times to exactly MAX_RESPONSE_TIMES (100)
-        client.response_times = [float(i) for i in range(100)]
+        client.response_times = deque(map(float, range(100)), maxlen=MAX_RESPONSE_TIMES)
 
         respx_mock.get(f"{GTEX_DEFAULT_BASE}/test/endpoint").respond(200, json={"data": "test"})
 
@@ -184,28 +223,28 @@ class TestGTExClientRateLimitingLogging:
         respx_mock: respx.MockRouter,
     ) -> None:
         """Test logging when rate limit is applied (wait_time > 0)."""
-        config = GTExAPIConfigModel(rate_limit_per_second=1.0, burst_size=1)  # Very restrictive
+        config = GTExAPIConfigModel(rate_limit_per_second=1.0, burst_size=1)
         logger = MagicMock()
         client = GTExClient(config=config, logger=logger)
 
         respx_mock.get(f"{GTEX_DEFAULT_BASE}/test/endpoint1").respond(200, json={"data": "test"})
         respx_mock.get(f"{GTEX_DEFAULT_BASE}/test/endpoint2").respond(200, json={"data": "test"})
 
-        # Make first request to consume tokens
         await client._make_request("GET", "test/endpoint1")
 
-        # Make second request immediately - should trigger rate limiting
-        await client._make_request("GET", "test/endpoint2")
+        # Empty the bucket right before the second call so it must wait no
+        # matter how long the first request took; the wait itself is mocked.
+        client.rate_limiter.tokens = 0.0
+        client.rate_limiter.last_update = time.monotonic_ns()
+        with patch("gtex_link.api.client.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await client._make_request("GET", "test/endpoint2")
 
-        # Verify rate limit logging was called
-        logger.debug.assert_called()
-        # Check if any debug call was about rate limiting
-        debug_calls = [
-            call
-            for call in logger.debug.call_args_list
-            if len(call[0]) > 0 and "Rate limit applied" in call[0][0]
-        ]
-        assert len(debug_calls) > 0
+        sleep.assert_awaited_once()
+        assert sleep.await_args is not None
+        assert sleep.await_args.args[0] > 0
+
+        # Verify the rate limit wait was logged
+        logger.debug.assert_any_call("Rate limit applied", wait_time=ANY)
 
         await client.close()
 
@@ -356,7 +395,7 @@ class TestGTExClientEndpointMethods:
         client = GTExClient(config=config, logger=None)
 
         # Add some test data
-        client.response_times = [0.1, 0.2, 0.3]
+        client.response_times = deque([0.1, 0.2, 0.3], maxlen=MAX_RESPONSE_TIMES)
         client.total_requests = 3
         client.successful_requests = 3
 
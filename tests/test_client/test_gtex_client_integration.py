@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
@@ -59,6 +61,13 @@ class TestGTExClientInitialization:
         assert client._rate_limiter.rate == 10.0
         assert client._rate_limiter.burst == 50
 
+    def test_endpoint_urls_precomputed(self, test_api_config: GTExAPIConfigModel) -> None:
+        """Test that every configured endpoint is joined to the base URL up front."""
+        client = GTExClient(config=test_api_config)
+
+        assert client._endpoint_urls["reference/geneSearch"] == f"{GTEX_BASE}/reference/geneSearch"
+        assert len(client._endpoint_urls) == len(test_api_config.endpoints)
+
 
 class TestGTExClientSessionManagement:
     """Test client session management and lifecycle."""
@@ -94,6 +103,23 @@ class TestGTExClientSessionManagement:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_session_reused_across_requests(
+        self, test_api_config: GTExAPIConfigModel, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test that repeated requests share one lazily built HTTP session."""
+        respx_mock.get(f"{GTEX_BASE}/test/endpoint").respond(200, json={"data": []})
+        client = GTExClient(config=test_api_config)
+
+        with patch("gtex_link.api.client.httpx.AsyncClient", wraps=httpx.AsyncClient) as factory:
+            for _ in range(3):
+                await client._make_request("GET", "test/endpoint")
+
+        assert factory.call_count == 1
+        assert client._session is not None
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_session_headers_configuration(self, test_api_config: GTExAPIConfigModel) -> None:
         """Test that session has correct headers."""
@@ -128,8 +154,6 @@ class TestGTExClientRateLimiting:
             mock_request.return_value = {"data": []}
 
             # Make multiple requests rapidly
-            import asyncio
-
             tasks = [
                 client.search_genes(query="BRCA1"),
                 client.search_genes(query="TP53"),
@@ -160,12 +184,11 @@ class TestGTExClientRateLimiting:
         await client.close()
 
     @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_rate_limiter_token_replenishment(
         self, test_api_config: GTExAPIConfigModel
     ) -> None:
         """Test that rate limiter tokens are replenished over time."""
-        import asyncio
-
         config = GTExAPIConfigModel(
             base_url=test_api_config.base_url,
             rate_limit_per_second=10.0,  # Fast replenishment for testing
@@ -185,10 +208,7 @@ class TestGTExClientRateLimiting:
 
         # Tokens are replenished on next acquire call, so let's access the rate limiter
         # to trigger the replenishment calculation without consuming a token
-        import time
-
-        now = time.time()
-        elapsed = now - client._rate_limiter.last_update
+        elapsed = (time.monotonic_ns() - client._rate_limiter.last_update) / 1e9
         expected_tokens = min(
             client._rate_limiter.burst, initial_tokens + elapsed * client._rate_limiter.rate
         )
@@ -495,8 +515,6 @@ class TestGTExClientConcurrency:
             mock_request.return_value = {"data": []}
 
             # Make multiple concurrent requests
-            import asyncio
-
             async def make_request(gene: str) -> dict[str, Any]:
                 return await client.search_genes(query=gene)
 
@@ -521,8 +539,6 @@ class TestGTExClientConcurrency:
         client = GTExClient(config=test_api_config)
 
         # Create multiple concurrent tasks that create sessions
-        import asyncio
-
         async def get_session_task() -> httpx.AsyncClient:
             return await client._get_session()
 
@@ -553,8 +569,6 @@ class TestGTExClientConcurrency:
             mock_request.return_value = {"data": []}
 
             # Make many concurrent requests
-            import asyncio
-
             async def make_request(i: int) -> dict[str, Any]:
                 return await client.search_genes(query=f"GENE{i}")
 
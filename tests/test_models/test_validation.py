@@ -1,5 +1,7 @@
 """Test Pydantic model validation."""
 
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 
@@ -7,11 +9,14 @@ from gtex_link.models import (
     Chromosome,
     DatasetId,
     Gene,
+    GeneExpressionRequest,
     GeneRequest,
     GeneSearchRequest,
     MedianGeneExpression,
+    MedianGeneExpressionRequest,
     PaginatedGeneResponse,
     TissueSiteDetailId,
+    TopExpressedGenesRequest,
     VariantByLocationRequest,
 )
 
@@ -22,8 +27,6 @@ class TestEnumValidation:
     def test_chromosome_enum_valid(self):
         """Test valid chromosome values."""
         # Test that Literal types work correctly
-        from typing import get_args
-
         valid_chromosomes = get_args(Chromosome)
         assert "chr1" in valid_chromosomes
         assert "chrX" in valid_chromosomes
@@ -31,16 +34,12 @@ class TestEnumValidation:
 
     def test_dataset_id_enum_valid(self):
         """Test valid dataset ID values."""
-        from typing import get_args
-
         valid_datasets = get_args(DatasetId)
         assert "gtex_v8" in valid_datasets
         assert "gtex_v10" in valid_datasets
 
     def test_tissue_site_detail_id_enum_valid(self):
         """Test valid tissue site detail ID values."""
-        from typing import get_args
-
         valid_tissues = get_args(TissueSiteDetailId)
         assert "Whole_Blood" in valid_tissues
         assert "Brain_Cortex" in valid_tissues
@@ -112,6 +111,32 @@ class TestRequestModels:
         with pytest.raises(ValidationError):
             GeneRequest(gene_id=["BRCA1"], page=-1)
 
+    @pytest.mark.parametrize(
+        ("model", "params"),
+        [
+            pytest.param(MedianGeneExpressionRequest, {}, id="median_missing_gencode_id"),
+            pytest.param(
+                MedianGeneExpressionRequest, {"gencodeId": []}, id="median_empty_gencode_id"
+            ),
+            pytest.param(TopExpressedGenesRequest, {}, id="top_missing_tissue"),
+            pytest.param(
+                TopExpressedGenesRequest,
+                {"tissueSiteDetailId": "Invalid_Tissue"},
+                id="top_invalid_tissue",
+            ),
+            pytest.param(GeneExpressionRequest, {}, id="individual_missing_gencode_id"),
+            pytest.param(
+                GeneExpressionRequest,
+                {"gencodeId": ["ENSG00000012048.20"], "itemsPerPage": 1001},
+                id="individual_page_size_too_large",
+            ),
+        ],
+    )
+    def test_expression_request_invalid(self, model, params):
+        """Test expression request models reject the inputs the routes answer with 422."""
+        with pytest.raises(ValidationError):
+            model(**params)
+
 
 class TestResponseModels:
     """Test response model validation."""
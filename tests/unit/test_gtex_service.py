@@ -1,16 +1,38 @@
 """Comprehensive tests for GTEx service with real data patterns."""
 
+import asyncio
+from itertools import batched
+from typing import Final
+
 import pytest
 
 from gtex_link.exceptions import GTExAPIError, ValidationError
 from gtex_link.models import (
+    DatasetSampleRequest,
+    GeneExpressionRequest,
     MedianGeneExpressionRequest,
     PaginatedGeneResponse,
     PaginatedMedianGeneExpressionResponse,
     ServiceInfo,
+    SubjectRequest,
+    TissueSiteDetailRequest,
+    VariantByLocationRequest,
+    VariantRequest,
 )
 from gtex_link.services.gtex_service import GTExService
 
+# Tissues compared in the tissue comparison workflow, and the pinned number of
+# upstream calls that workflow must make (one per tissue).
+COMPARISON_TISSUES: Final = (
+    "Breast_Mammary_Tissue",
+    "Whole_Blood",
+    "Brain_Cortex",
+    "Liver",
+)
+EXPECTED_COMPARISON_CALL_COUNT: Final[int] = 4
+# 100 distinct versioned GENCODE IDs, so every batch below is a different request.
+BATCH_GENCODE_IDS: Final[tuple[str, ...]] = tuple(f"ENSG{i:011d}.1" for i in range(100))
+
 
 class TestGTExServiceInitialization:
     """Test GTEx service initialization and configuration."""
@@ -299,6 +321,42 @@ class TestGTExServicePerformance:
         assert isinstance(result, PaginatedGeneResponse)
         mock_gtex_client.search_genes.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_large_gene_list_batched_expression(
+        self,
+        mock_gtex_client,
+        test_cache_config,
+        mock_logger,
+        median_expression_response,
+    ):
+        """Test median expression over a large gene list fetched in concurrent batches."""
+        service = GTExService(mock_gtex_client, test_cache_config, mock_logger)
+
+        mock_gtex_client.get_median_gene_expression.return_value = median_expression_response
+
+        # ``batched`` yields tuples lazily, so no intermediate slice copies are made.
+        chunks = list(batched(BATCH_GENCODE_IDS, 10))
+        requests = [
+            MedianGeneExpressionRequest(
+                gencode_id=list(chunk),
+                tissue_site_detail_id="Breast_Mammary_Tissue",
+            )
+            for chunk in chunks
+        ]
+        results = await asyncio.gather(
+            *(service.get_median_gene_expression(request) for request in requests)
+        )
+
+        assert len(results) == len(chunks)
+        for result in results:
+            assert isinstance(result, PaginatedMedianGeneExpressionResponse)
+        # Every batch reached the client (none was answered from the cache),
+        # each forwarding exactly its own chunk of IDs.
+        awaited = mock_gtex_client.get_median_gene_expression.await_args_list
+        assert len(awaited) == len(chunks)
+        forwarded = sorted(tuple(call.args[0]["gencodeId"]) for call in awaited)
+        assert forwarded == sorted(chunks)
+
     @pytest.mark.asyncio
     async def test_pagination_scenarios(
         self,
@@ -374,15 +432,6 @@ class TestGTExServiceMissingCoverage:
         self, mock_gtex_client, test_cache_config, mock_logger
     ):
         """Test that logger.info calls are executed for coverage of missing lines."""
-        from gtex_link.models import (
-            DatasetSampleRequest,
-            GeneExpressionRequest,
-            SubjectRequest,
-            TissueSiteDetailRequest,
-            VariantByLocationRequest,
-            VariantRequest,
-        )
-
         service = GTExService(mock_gtex_client, test_cache_config, mock_logger)
         empty_paginated_response = {
             "data": [],
@@ -432,8 +481,6 @@ class TestGTExServiceMissingCoverage:
         self, mock_gtex_client, test_cache_config, mock_logger
     ):
         """Test tissueSiteDetailId empty string filtering logic."""
-        from gtex_link.models import GeneExpressionRequest
-
         # Note: service instance not needed for this test, just testing the logic
         # service = GTExService(mock_gtex_client, test_cache_config, mock_logger)
 
@@ -514,15 +561,8 @@ class TestGTExServiceRealWorldScenarios:
         mock_gtex_client.get_median_gene_expression.return_value = median_expression_response
 
         # Compare expression across multiple tissues
-        tissues = [
-            "Breast_Mammary_Tissue",
-            "Whole_Blood",
-            "Brain_Cortex",
-            "Liver",
-        ]
-
         tissue_results = []
-        for tissue in tissues:
+        for tissue in COMPARISON_TISSUES:
             request = MedianGeneExpressionRequest(
                 gencode_id=["ENSG00000012048.20"],  # BRCA1 GENCODE ID
                 tissue_site_detail_id=tissue,
@@ -530,11 +570,13 @@ class TestGTExServiceRealWorldScenarios:
             result = await service.get_median_gene_expression(request)
             tissue_results.append(result)
 
-        assert len(tissue_results) == 4
+        assert len(tissue_results) == EXPECTED_COMPARISON_CALL_COUNT
         for result in tissue_results:
             assert isinstance(result, PaginatedMedianGeneExpressionResponse)
 
-        assert mock_gtex_client.get_median_gene_expression.call_count == 4
+        assert (
+            mock_gtex_client.get_median_gene_expression.call_count == EXPECTED_COMPARISON_CALL_COUNT
+        )
 
     @pytest.mark.asyncio
     @pytest.mark.slow
@@ -186,7 +186,7 @@ def test_get_genes_route_gene_id_not_logged(respx_mock: respx.MockRouter) -> Non
         resp = client.get("/api/reference/gene", params={"geneId": SENTINEL_GENCODE})
         assert resp.status_code == 200
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_logger_dependency, None)
 
     assert SENTINEL_GENCODE not in _logged_text(mock)
 
@@ -202,7 +202,7 @@ def test_get_transcripts_route_gencode_id_not_logged(respx_mock: respx.MockRoute
         resp = client.get("/api/reference/transcript", params={"gencodeId": SENTINEL_GENCODE})
         assert resp.status_code == 200
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_logger_dependency, None)
 
     assert SENTINEL_GENCODE not in _logged_text(mock)
 
@@ -233,7 +233,7 @@ def test_search_genes_route_query_not_logged(respx_mock: respx.MockRouter) -> No
         resp = client.get("/api/reference/geneSearch", params={"geneId": SENTINEL})
         assert resp.status_code == 200
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_logger_dependency, None)
 
     assert SENTINEL not in _logged_text(mock)
 
@@ -0,0 +1,35 @@
+"""Tests for the shared GTEx client behind the REST route dependencies."""
+
+from __future__ import annotations
+
+import pytest
+
+from gtex_link.api.routes.dependencies import close_gtex_client, get_gtex_client
+
+
+class TestSharedGTExClient:
+    """Test that REST routes share one GTEx client per process."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_across_requests(self) -> None:
+        """Test that every resolution returns the same client instance."""
+        first = await get_gtex_client()
+        second = await get_gtex_client()
+
+        assert first is second
+        assert first.rate_limiter is second.rate_limiter
+
+        await close_gtex_client()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_session_and_rebuilds(self) -> None:
+        """Test that closing the shared client drops its session and the cache."""
+        client = await get_gtex_client()
+        await client._get_session()
+
+        await close_gtex_client()
+
+        assert client._session is None
+        assert await get_gtex_client() is not client
+
+        await close_gtex_client()